@@ -1,10 +1,14 @@
 # File: main.py
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from briscola import BriscolaGame, Player, Card 
+from briscola import metrics
+import time
 import uuid
 
 app = FastAPI()
@@ -18,9 +22,47 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+
+class RequestLatencyMiddleware:
+    """Plain ASGI middleware recording per-route request latency for /metrics."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router fills in scope["route"]; label by its template, not the
+            # raw path, to keep cardinality bounded
+            route_path = getattr(scope.get("route"), "path", "unmatched")
+            metrics.REQUEST_LATENCY.labels(
+                scope["method"], route_path, str(status)
+            ).observe(time.perf_counter() - start)
+
+
+app.add_middleware(RequestLatencyMiddleware)
+
+
 # In-memory storage for active games
 games = {}
 
+# Upper bound on a single profiling run, in seconds
+MAX_PROFILE_SECONDS = 60.0
+
 
 class GameCreate(BaseModel):
     player_names: List[str]
@@ -49,6 +91,22 @@ class GameState(BaseModel):
     players: List[PlayerInfo]
 
 
+class PlayerView(BaseModel):
+    game_id: str
+    player: str
+    team: Optional[int]
+    current_player: str
+    briscola_card: CardInfo
+    tricks_played: int
+    cards_left_in_deck: int
+    hand: List[CardInfo]
+    current_trick: List[CardInfo]
+    captured_cards: Dict[int, List[CardInfo]]
+    seen_cards: List[CardInfo]
+    unseen_cards: List[CardInfo]
+    players: List[PlayerInfo]
+
+
 class CardPlay(BaseModel):
     rank: str
     suit: str
@@ -63,7 +121,12 @@ class PlayCard(BaseModel):
 async def create_game(game_create: GameCreate):
     """Create a new Briscola game."""
     game_id = str(uuid.uuid4())
-    games[game_id] = BriscolaGame(game_create.player_names)
+    try:
+        games[game_id] = BriscolaGame(game_create.player_names)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    metrics.GAMES_CREATED.inc()
+    metrics.GAMES_ACTIVE.inc()
     return game_id
 
 
@@ -104,12 +167,38 @@ async def play_card(game_id: str, play: PlayCard):
         None,
     )
     if not card_to_play:
-        raise HTTPException(status_code=400, detail=f"Invalid card, the valid cards are: {current_player.hand}")
+        raise HTTPException(status_code=400, detail="Invalid card, it is not in your hand")
 
     game.play_turn(card_to_play)
+    if game.is_game_over():
+        metrics.GAMES_FINISHED.inc()
+        metrics.GAMES_ACTIVE.dec()
     return {"message": "Card played successfully"}
 
 
+@app.delete("/games/{game_id}")
+async def delete_game(game_id: str):
+    """Remove a game from storage."""
+    game = games.pop(game_id, None)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    metrics.GAMES_EVICTED.inc()
+    if not game.is_game_over():
+        metrics.GAMES_ACTIVE.dec()
+    return {"message": "Game deleted"}
+
+
+@app.get("/games/{game_id}/view", response_model=PlayerView)
+async def get_player_view(game_id: str, player: str):
+    """Get the game as seen by one player, with the other hands hidden."""
+    if game_id not in games:
+        raise HTTPException(status_code=404, detail="Game not found")
+    game = games[game_id]
+    if player not in game.knowledge:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return PlayerView(game_id=game_id, **game.get_player_view(player))
+
+
 @app.get("/games/{game_id}/winner")
 async def get_winner(game_id: str):
     """Get the winner of the game."""
@@ -125,6 +214,52 @@ async def get_winner(game_id: str):
         return {"winner": f"Team {winner}"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Expose server and engine metrics in Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render_metrics(), media_type="text/plain; version=0.0.4"
+    )
+
+
+def require_debug_endpoints():
+    """Hide the /debug endpoints unless BRISCOLA_DEBUG_ENDPOINTS is set."""
+    if not metrics.debug_endpoints_enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@app.post("/debug/profile", response_class=PlainTextResponse)
+async def profile(seconds: float = 5.0, interval: float = 0.005):
+    """
+    Run the sampling profiler for the given duration and return a
+    collapsed-stack dump suitable for flamegraph.pl or speedscope.
+    """
+    require_debug_endpoints()
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be between 0 and {MAX_PROFILE_SECONDS}",
+        )
+    if interval < metrics.MIN_PROFILE_INTERVAL:
+        raise HTTPException(
+            status_code=400,
+            detail=f"interval must be at least {metrics.MIN_PROFILE_INTERVAL}",
+        )
+    try:
+        collapsed = await run_in_threadpool(metrics.profile_for, seconds, interval)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(collapsed)
+
+
+@app.post("/debug/engine-timing")
+async def set_engine_timing(enabled: bool):
+    """Turn the timing hooks around BriscolaGame engine calls on or off."""
+    require_debug_endpoints()
+    metrics.enable_engine_timing(enabled)
+    return {"engine_timing": metrics.engine_timing_enabled()}
+
+
 if __name__ == "__main__":
     import uvicorn
 
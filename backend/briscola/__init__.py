@@ -1,5 +1,6 @@
 from .deck import Card, Deck
 from .player import Player
-from .briscola import BriscolaGame
+from .knowledge import SeatKnowledge
+from .briscola import BriscolaGame, GameEvent
 
-__all__ = ['Card', 'Deck', 'Player', 'BriscolaGame']
\ No newline at end of file
+__all__ = ['Card', 'Deck', 'Player', 'BriscolaGame', 'GameEvent', 'SeatKnowledge']
\ No newline at end of file
@@ -1,7 +1,21 @@
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from typing import Callable, List, Optional, Dict
+from pydantic import BaseModel, Field, PrivateAttr
 from .player import Player
 from .deck import Deck, Card
+from .knowledge import SeatKnowledge
+from .metrics import timed
+
+
+class GameEvent(BaseModel):
+    """
+    A change to the game state, published to subscribers of a BriscolaGame.
+    Types are card_played, trick_won, card_drawn, turn and game_over.
+    """
+
+    type: str
+    player: Optional[str] = None
+    card: Optional[Card] = None
+    points: int = 0
 
 
 class BriscolaGame(BaseModel):
@@ -11,37 +25,67 @@ class BriscolaGame(BaseModel):
     current_player_index: int = 0
     current_trick: List[Card] = Field(default_factory=list)
     tricks_played: int = 0
+    captured_cards: Dict[int, List[Card]] = Field(
+        default_factory=lambda: {1: [], 2: []}
+    )
+    knowledge: Dict[str, SeatKnowledge] = Field(default_factory=dict)
+    _listeners: List[Callable[[GameEvent], None]] = PrivateAttr(default_factory=list)
 
     def __init__(self, player_names: List[str], **data):
         super().__init__(**data)
         if len(player_names) not in [2, 4]:
             raise ValueError("Briscola requires either 2 or 4 players")
+        if len(set(player_names)) != len(player_names):
+            raise ValueError("Player names must be unique")
         self.players = [
             Player(name=name, team=(i % 2) + 1) for i, name in enumerate(player_names)
         ]
-        self.deck = Deck()
+        self.knowledge = {name: SeatKnowledge() for name in player_names}
         self.deal_initial_cards()
         self.set_briscola()
 
     def add_player(self, player: Player) -> None:
         """Adds a player to the game."""
+        if any(p.name == player.name for p in self.players):
+            raise ValueError("Player names must be unique")
         if len(self.players) < 4:
             self.players.append(player)
+            self.knowledge[player.name] = SeatKnowledge()
             if len(self.players) == 1:
                 self.deal_initial_cards()
                 self.set_briscola()
 
+    def subscribe(self, listener: Callable[[GameEvent], None]) -> None:
+        """Registers a callback invoked with every GameEvent."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[GameEvent], None]) -> None:
+        """Removes a previously registered callback."""
+        self._listeners.remove(listener)
+
+    def _emit(self, type: str, **data) -> None:
+        """Publishes an event; a no-op when nobody is listening."""
+        if self._listeners:
+            event = GameEvent(type=type, **data)
+            for listener in list(self._listeners):
+                listener(event)
+
     def set_briscola(self):
         """Sets the Briscola card and places it at the bottom of the deck."""
         self.briscola_card = self.deck.draw()
         self.deck.cards.insert(0, self.briscola_card)
+        for seat in self.knowledge.values():
+            seat.see(self.briscola_card)
 
     def deal_initial_cards(self):
         """Deals the initial three cards to each player."""
         for _ in range(3):
             for player in self.players:
-                player.add_card(self.deck.draw())
+                card = self.deck.draw()
+                player.add_card(card)
+                self.knowledge[player.name].see(card)
 
+    @timed("replenish_hands")
     def replenish_hands(self) -> None:
         """
         Replenishes each player's hand with one card after a trick,
@@ -57,12 +101,18 @@ class BriscolaGame(BaseModel):
             if self.deck.cards:
                 drawn_card = self.deck.draw()
                 player.add_card(drawn_card)
+                self.knowledge[player.name].see(drawn_card)
+                self._emit("card_drawn", player=player.name, card=drawn_card)
 
+    @timed("play_turn")
     def play_turn(self, card: Card) -> None:
         """Handles the logic for a player playing a card."""
         current_player = self.get_current_player()
         played_card = current_player.play_card(card)
         self.current_trick.append(played_card)
+        for seat in self.knowledge.values():
+            seat.see(played_card)
+        self._emit("card_played", player=current_player.name, card=played_card)
 
         if len(self.current_trick) == len(self.players):
             self.resolve_trick()
@@ -71,6 +121,12 @@ class BriscolaGame(BaseModel):
                 self.players
             )
 
+        if self.is_game_over():
+            self._emit("game_over")
+        else:
+            self._emit("turn", player=self.get_current_player().name)
+
+    @timed("resolve_trick")
     def resolve_trick(self) -> None:
         """Resolves the current trick and updates game state."""
         winning_card = self.determine_winning_card()
@@ -80,9 +136,11 @@ class BriscolaGame(BaseModel):
         )
 
         winning_player.add_to_score(trick_points)
+        self.captured_cards[winning_player.team].extend(self.current_trick)
         self.current_player_index = self.players.index(winning_player)
 
         self.tricks_played += 1
+        self._emit("trick_won", player=winning_player.name, points=trick_points)
         if not self.is_game_over():
             self.replenish_hands()
 
@@ -125,6 +183,7 @@ class BriscolaGame(BaseModel):
         for player in self.players:
             player.played_cards.clear()
 
+    @timed("get_game_state")
     def get_game_state(self) -> dict:
         """Returns the current state of the game."""
         return {
@@ -151,6 +210,42 @@ class BriscolaGame(BaseModel):
             ],
         }
 
+    @timed("get_player_view")
+    def get_player_view(self, player_name: str) -> dict:
+        """
+        Returns the game as seen from one seat: the public state plus that
+        seat's own hand and card tracking, with every other hand hidden.
+        """
+        player = next((p for p in self.players if p.name == player_name), None)
+        if player is None:
+            raise ValueError(f"No player named {player_name}")
+        seat = self.knowledge[player_name]
+        return {
+            "player": player.name,
+            "team": player.team,
+            "current_player": self.get_current_player().name,
+            "briscola_card": self.briscola_card.to_dict(),
+            "tricks_played": self.tricks_played,
+            "cards_left_in_deck": len(self.deck.cards),
+            "hand": [card.to_dict() for card in player.hand],
+            "current_trick": [card.to_dict() for card in self.current_trick],
+            "captured_cards": {
+                team: [card.to_dict() for card in cards]
+                for team, cards in self.captured_cards.items()
+            },
+            "seen_cards": [card.to_dict() for card in seat.seen],
+            "unseen_cards": [card.to_dict() for card in seat.sorted_unseen()],
+            "players": [
+                {
+                    "name": p.name,
+                    "team": p.team,
+                    "score": p.score,
+                    "hand_size": p.get_hand_size(),
+                }
+                for p in self.players
+            ],
+        }
+
     def get_winner(self) -> Optional[Player | int]:
         """
         Determines the winner of the game based on the highest score.
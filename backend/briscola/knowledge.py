@@ -0,0 +1,38 @@
+from typing import List, Set
+from pydantic import BaseModel, Field
+from .deck import Card, Deck
+
+
+def full_deck() -> List[Card]:
+    """Returns all 40 cards in suit and rank order."""
+    return [
+        Card(rank=rank, suit=suit, value=Deck.VALUES[rank])
+        for suit in Deck.SUITS
+        for rank in Deck.RANKS
+    ]
+
+
+def card_order(card: Card) -> tuple:
+    """Sort key placing cards in suit and rank order."""
+    return (Deck.SUITS.index(card.suit), Deck.RANKS.index(card.rank))
+
+
+class SeatKnowledge(BaseModel):
+    """
+    What a single seat has observed: the cards it has seen (its own draws, the
+    Briscola card and every card played) and the cards it has not seen yet.
+    Updated incrementally by BriscolaGame as cards are dealt, drawn and played.
+    """
+
+    seen: List[Card] = Field(default_factory=list)
+    unseen: Set[Card] = Field(default_factory=lambda: set(full_deck()))
+
+    def see(self, card: Card) -> None:
+        """Records that the seat has seen a card."""
+        if card in self.unseen:
+            self.unseen.discard(card)
+            self.seen.append(card)
+
+    def sorted_unseen(self) -> List[Card]:
+        """Returns the unseen cards in suit and rank order."""
+        return sorted(self.unseen, key=card_order)
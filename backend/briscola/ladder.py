@@ -0,0 +1,279 @@
+"""
+TrueSkill rating ladder for registered strategies.
+
+Strategies play duplicate matches: the same seeded deal is played twice with
+the seats swapped, so each side gets the other's cards in the second game and
+the luck of the deal largely cancels out. A match is won by the side that
+captures more points over both games. In 2v2 mode each ladder entry plays
+both seats of a team (Player.team), so the ratings are team ratings.
+
+Rather than playing a fixed number of games per pair, the scheduler spends
+matches on the pairings whose order is still most uncertain and stops once
+every adjacent pair in the standings is separated with the requested
+confidence.
+"""
+
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import sqrt
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .briscola import BriscolaGame
+from .deck import Deck
+from .knowledge import full_deck
+from .strategies import STRATEGIES, get_strategy
+
+_NORMAL = NormalDist()
+
+MODES = {"1v1": 2, "2v2": 4}
+
+
+class Rating(BaseModel):
+    """A Gaussian skill belief."""
+
+    mu: float = 25.0
+    sigma: float = 25.0 / 3
+
+    @property
+    def conservative(self) -> float:
+        """A skill estimate the entry is very likely to exceed."""
+        return self.mu - 3 * self.sigma
+
+
+class TrueSkill(BaseModel):
+    """Two-entry TrueSkill update rules with draws."""
+
+    mu: float = 25.0
+    sigma: float = 25.0 / 3
+    beta: float = 25.0 / 6
+    tau: float = 25.0 / 300
+    draw_probability: float = 0.02
+
+    def create_rating(self) -> Rating:
+        """Returns the prior rating for a new entry."""
+        return Rating(mu=self.mu, sigma=self.sigma)
+
+    def draw_margin(self) -> float:
+        """Performance difference below which a match is a draw."""
+        return _NORMAL.inv_cdf((self.draw_probability + 1) / 2) * sqrt(2) * self.beta
+
+    def win_probability(self, a: Rating, b: Rating) -> float:
+        """Probability that a beats b in a single match."""
+        c = sqrt(2 * self.beta**2 + a.sigma**2 + b.sigma**2)
+        return _NORMAL.cdf((a.mu - b.mu) / c)
+
+    def rate(
+        self, winner: Rating, loser: Rating, drawn: bool = False
+    ) -> Tuple[Rating, Rating]:
+        """Returns the updated ratings of the winner and loser (or both sides of a draw)."""
+        winner_var = winner.sigma**2 + self.tau**2
+        loser_var = loser.sigma**2 + self.tau**2
+        c = sqrt(2 * self.beta**2 + winner_var + loser_var)
+        t = (winner.mu - loser.mu) / c
+        e = self.draw_margin() / c
+
+        if drawn:
+            v, w = _v_draw(t, e), _w_draw(t, e)
+        else:
+            v, w = _v_win(t, e), _w_win(t, e)
+
+        def update(mu: float, var: float, sign: int) -> Rating:
+            return Rating(
+                mu=mu + sign * var / c * v,
+                sigma=sqrt(var * max(1 - var / c**2 * w, 1e-6)),
+            )
+
+        return update(winner.mu, winner_var, 1), update(loser.mu, loser_var, -1)
+
+
+def _v_win(t: float, e: float) -> float:
+    x = t - e
+    denom = _NORMAL.cdf(x)
+    return _NORMAL.pdf(x) / denom if denom > 1e-12 else -x
+
+
+def _w_win(t: float, e: float) -> float:
+    v = _v_win(t, e)
+    return min(max(v * (v + t - e), 0.0), 1.0)
+
+
+def _v_draw(t: float, e: float) -> float:
+    a, b = e - abs(t), -e - abs(t)
+    denom = _NORMAL.cdf(a) - _NORMAL.cdf(b)
+    v = (_NORMAL.pdf(b) - _NORMAL.pdf(a)) / denom if denom > 1e-12 else a
+    return -v if t < 0 else v
+
+
+def _w_draw(t: float, e: float) -> float:
+    a, b = e - abs(t), -e - abs(t)
+    denom = _NORMAL.cdf(a) - _NORMAL.cdf(b)
+    if denom <= 1e-12:
+        return 1.0
+    v = _v_draw(abs(t), e)
+    return min(max(v**2 + (a * _NORMAL.pdf(a) - b * _NORMAL.pdf(b)) / denom, 0.0), 1.0)
+
+
+def play_game(seats: List[str], deck: Deck, seed: int) -> List[int]:
+    """
+    Plays one game with the given strategy per seat on the given deck and
+    returns the points of team 1 and team 2.
+    """
+    rng = random.Random(seed)  # Random strategies see the same stream in both seatings
+    game = BriscolaGame([f"Seat {i + 1}" for i in range(len(seats))], deck=deck)
+    strategies = [get_strategy(name) for name in seats]
+    while not game.is_game_over():
+        strategy = strategies[game.current_player_index]
+        game.play_turn(strategy(game, rng))
+
+    team_points = [0, 0]
+    for player in game.players:
+        team_points[player.team - 1] += player.score
+    return team_points
+
+
+def play_duplicate_match(a: str, b: str, mode: str, seed: int) -> Tuple[int, int]:
+    """
+    Plays the same seeded deal twice with the seats swapped and returns the
+    total points of a and b over both games.
+    """
+    seats_per_team = MODES[mode] // 2
+    cards = full_deck()
+    random.Random(seed).shuffle(cards)
+
+    first = play_game([a, b] * seats_per_team, Deck(cards=list(cards)), seed)
+    second = play_game([b, a] * seats_per_team, Deck(cards=list(cards)), seed)
+    return first[0] + second[1], first[1] + second[0]
+
+
+def _play_scheduled(match: Tuple[str, str, str, int]) -> Tuple[int, int]:
+    return play_duplicate_match(*match)
+
+
+class RatingLadder:
+    """Adaptive TrueSkill ladder over registered strategies."""
+
+    def __init__(
+        self,
+        strategies: List[str],
+        mode: str = "1v1",
+        env: Optional[TrueSkill] = None,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Mode must be one of {sorted(MODES)}")
+        if len(set(strategies)) < 2:
+            raise ValueError("A ladder needs at least two distinct strategies")
+        for name in strategies:
+            get_strategy(name)
+
+        self.mode = mode
+        self.env = env or TrueSkill()
+        self.workers = workers
+        self.ratings: Dict[str, Rating] = {
+            name: self.env.create_rating() for name in dict.fromkeys(strategies)
+        }
+        self.matches_played = 0
+        self._rng = random.Random(seed)
+
+    @property
+    def games_played(self) -> int:
+        """Number of games played; every duplicate match is two games."""
+        return 2 * self.matches_played
+
+    def record(self, a: str, b: str, points_a: int, points_b: int) -> None:
+        """Updates the ratings with the result of a duplicate match."""
+        if points_a == points_b:
+            self.ratings[a], self.ratings[b] = self.env.rate(
+                self.ratings[a], self.ratings[b], drawn=True
+            )
+        elif points_a > points_b:
+            self.ratings[a], self.ratings[b] = self.env.rate(
+                self.ratings[a], self.ratings[b]
+            )
+        else:
+            self.ratings[b], self.ratings[a] = self.env.rate(
+                self.ratings[b], self.ratings[a]
+            )
+        self.matches_played += 1
+
+    def order_confidence(self, a: str, b: str) -> float:
+        """Probability that the higher-rated of a and b really is the stronger."""
+        ra, rb = self.ratings[a], self.ratings[b]
+        p = _NORMAL.cdf((ra.mu - rb.mu) / sqrt(ra.sigma**2 + rb.sigma**2))
+        return max(p, 1 - p)
+
+    def standings(self) -> List[Tuple[str, Rating]]:
+        """Returns the entries ordered from strongest to weakest."""
+        return sorted(self.ratings.items(), key=lambda item: item[1].mu, reverse=True)
+
+    def is_resolved(self, confidence: float) -> bool:
+        """Checks whether every adjacent pair in the standings is ordered with the given confidence."""
+        names = [name for name, _ in self.standings()]
+        return all(
+            self.order_confidence(a, b) >= confidence for a, b in zip(names, names[1:])
+        )
+
+    def next_pairings(self, count: int) -> List[Tuple[str, str]]:
+        """
+        Samples pairings for the next batch of matches, weighted by the
+        probability that the current order of the pair is wrong.
+        """
+        pairs = list(combinations(self.ratings, 2))
+        weights = [1 - self.order_confidence(a, b) for a, b in pairs]
+        if not any(weights):
+            weights = None
+        return self._rng.choices(pairs, weights=weights, k=count)
+
+    def run(
+        self,
+        confidence: float = 0.95,
+        max_matches: int = 5000,
+        batch_size: Optional[int] = None,
+    ) -> List[Tuple[str, Rating]]:
+        """
+        Plays matches in parallel batches until the standings are resolved
+        with the given confidence or max_matches have been played.
+        """
+        batch_size = batch_size or 4 * (self.workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while self.matches_played < max_matches and not self.is_resolved(confidence):
+                count = min(batch_size, max_matches - self.matches_played)
+                matches = [
+                    (a, b, self.mode, self._rng.randrange(2**31))
+                    for a, b in self.next_pairings(count)
+                ]
+                for (a, b, _, _), (points_a, points_b) in zip(
+                    matches, executor.map(_play_scheduled, matches)
+                ):
+                    self.record(a, b, points_a, points_b)
+        return self.standings()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate registered strategies.")
+    parser.add_argument("strategies", nargs="*", default=sorted(STRATEGIES))
+    parser.add_argument("--mode", choices=sorted(MODES), default="1v1")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--max-matches", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    ladder = RatingLadder(
+        args.strategies, mode=args.mode, workers=args.workers, seed=args.seed
+    )
+    standings = ladder.run(confidence=args.confidence, max_matches=args.max_matches)
+    print(f"{ladder.games_played} games played ({args.mode})")
+    for rank, (name, rating) in enumerate(standings, start=1):
+        print(f"{rank}. {name}: mu={rating.mu:.2f} sigma={rating.sigma:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as _StackCounter
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Latency buckets in seconds, tuned for sub-millisecond engine calls up to slow HTTP requests.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Formats a label set in Prometheus exposition syntax."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in sorted(labels.items())
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class for metrics registered with a MetricsRegistry."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        """Returns the exposition lines for this metric."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increments the counter by the given amount."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name} {self._value:g}"]
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increments the gauge by the given amount."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrements the gauge by the given amount."""
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        """Sets the gauge to the given value."""
+        with self._lock:
+            self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name} {self._value:g}"]
+
+
+class _HistogramChild:
+    """Bucket counts for one label set of a Histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Records a single observation."""
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """Returns a consistent copy of the bucket counts and the sum."""
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class Histogram(_Metric):
+    """
+    A latency histogram with fixed buckets and optional labels.
+    Bucket counts are stored non-cumulatively and accumulated at render time,
+    so observing a value is a single bisect and increment.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation)
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple[str, ...], _HistogramChild] = {}
+
+    def labels(self, *values: str) -> _HistogramChild:
+        """Returns the child histogram for the given label values."""
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f"Expected {len(self.label_names)} label values, got {len(values)}"
+            )
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, _HistogramChild(self.buckets))
+        return child
+
+    def observe(self, value: float) -> None:
+        """Records an observation on an unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for values, child in sorted(self._children.items()):
+            labels = dict(zip(self.label_names, values))
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": f"{bound:g}"})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            cumulative += counts[-1]
+            inf_labels = _format_labels({**labels, "le": "+Inf"})
+            lines.append(f"{self.name}_bucket{inf_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total:g}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds a set of metrics and renders them in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Adds a metric to the registry and returns it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Renders all registered metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.register(
+    Histogram(
+        "briscola_http_request_duration_seconds",
+        "Latency of API requests by route.",
+        label_names=("method", "route", "status"),
+    )
+)
+GAMES_CREATED = REGISTRY.register(
+    Counter("briscola_games_created_total", "Number of games created.")
+)
+GAMES_ACTIVE = REGISTRY.register(
+    Gauge("briscola_games_active", "Number of games in progress.")
+)
+GAMES_FINISHED = REGISTRY.register(
+    Counter("briscola_games_finished_total", "Number of games played to completion.")
+)
+GAMES_EVICTED = REGISTRY.register(
+    Counter("briscola_games_evicted_total", "Number of games removed from storage.")
+)
+ENGINE_CALL_LATENCY = REGISTRY.register(
+    Histogram(
+        "briscola_engine_call_duration_seconds",
+        "Latency of BriscolaGame engine calls.",
+        label_names=("method",),
+    )
+)
+
+# Engine timing is off by default so the game loop pays only a flag check.
+_engine_timing_enabled = os.environ.get("BRISCOLA_ENGINE_TIMING", "") not in ("", "0")
+
+
+def enable_engine_timing(enabled: bool = True) -> None:
+    """Turns the timing hooks around BriscolaGame engine calls on or off."""
+    global _engine_timing_enabled
+    _engine_timing_enabled = enabled
+
+
+def engine_timing_enabled() -> bool:
+    """Returns whether the engine timing hooks are active."""
+    return _engine_timing_enabled
+
+
+def timed(method_name: str) -> Callable:
+    """
+    Decorator recording the duration of an engine method in ENGINE_CALL_LATENCY
+    when engine timing is enabled.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        child = ENGINE_CALL_LATENCY.labels(method_name)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _engine_timing_enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+# The /debug endpoints can stall or reconfigure the server, so they are off unless enabled
+_debug_endpoints_enabled = os.environ.get("BRISCOLA_DEBUG_ENDPOINTS", "") not in (
+    "",
+    "0",
+)
+
+
+def debug_endpoints_enabled() -> bool:
+    """Returns whether the API should serve the /debug endpoints."""
+    return _debug_endpoints_enabled
+
+
+def render_metrics() -> str:
+    """Renders the default registry in Prometheus text format."""
+    return REGISTRY.render()
+
+
+# Shortest sampling interval allowed; faster sampling starves the sampled threads
+MIN_PROFILE_INTERVAL = 0.001
+
+# Held while profile_for runs so only one profile is taken at a time
+_profile_lock = threading.Lock()
+
+
+class SamplingProfiler:
+    """
+    A wall-clock sampling profiler over all Python threads.
+    Stacks are aggregated in the collapsed format understood by flamegraph.pl
+    and speedscope: one line per unique stack, frames joined by ';', followed by
+    the number of samples.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        if interval < MIN_PROFILE_INTERVAL:
+            raise ValueError(
+                f"Sampling interval must be at least {MIN_PROFILE_INTERVAL} seconds"
+            )
+        self.interval = interval
+        self._stacks: _StackCounter = _StackCounter()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts sampling in a background thread."""
+        if self.running:
+            raise RuntimeError("Profiler is already running")
+        self._stacks.clear()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="briscola-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stops sampling and returns the collapsed-stack dump."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """Returns the samples collected so far in collapsed-stack format."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._stacks.most_common()
+        )
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                    )
+                    frame = frame.f_back
+                self._stacks[";".join(reversed(frames))] += 1
+
+
+def profile_for(duration: float, interval: float = 0.005) -> str:
+    """
+    Samples all threads for the given duration and returns the collapsed stacks.
+    Raises RuntimeError if another profile is already running.
+    """
+    profiler = SamplingProfiler(interval=interval)
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("A profile is already running")
+    try:
+        profiler.start()
+        time.sleep(duration)
+        return profiler.stop()
+    finally:
+        _profile_lock.release()
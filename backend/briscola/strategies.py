@@ -0,0 +1,108 @@
+import random
+from typing import Callable, Dict, List, Optional
+
+from .briscola import BriscolaGame
+from .deck import Card, Deck
+
+# A strategy picks the card the current player of a game should play. Strategies
+# that use randomness draw from rng when one is given, else the random module.
+Strategy = Callable[[BriscolaGame, Optional[random.Random]], Card]
+
+STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """Decorator registering a strategy under the given name."""
+
+    def decorator(strategy: Strategy) -> Strategy:
+        if name in STRATEGIES:
+            raise ValueError(f"Strategy '{name}' is already registered")
+        STRATEGIES[name] = strategy
+        return strategy
+
+    return decorator
+
+
+def get_strategy(name: str) -> Strategy:
+    """Returns the strategy registered under the given name."""
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy '{name}', the registered strategies are: {sorted(STRATEGIES)}"
+        ) from None
+
+
+def _strength(card: Card) -> tuple:
+    """Sort key ordering cards of the same suit from weakest to strongest."""
+    return (card.value, Deck.RANKS.index(card.rank))
+
+
+def _beats(card: Card, winning: Card, briscola_suit: str) -> bool:
+    """Checks whether card would take the trick from the currently winning card."""
+    if card.suit == winning.suit:
+        return _strength(card) > _strength(winning)
+    return card.suit == briscola_suit
+
+
+@register_strategy("first")
+def play_first(game: BriscolaGame, rng: Optional[random.Random] = None) -> Card:
+    """Plays the first card in hand."""
+    return game.get_current_player().hand[0]
+
+
+@register_strategy("random")
+def play_random(game: BriscolaGame, rng: Optional[random.Random] = None) -> Card:
+    """Plays a uniformly random card from hand."""
+    return (rng or random).choice(game.get_current_player().hand)
+
+
+@register_strategy("greedy")
+def play_greedy(game: BriscolaGame, rng: Optional[random.Random] = None) -> Card:
+    """
+    Leads with the cheapest card, keeping Briscole back. When following, takes
+    tricks worth points with the cheapest winning card, and otherwise throws
+    the cheapest card. Does not take a trick the partner is already winning.
+    """
+    player = game.get_current_player()
+    briscola_suit = game.briscola_card.suit
+
+    def discard_key(card: Card) -> tuple:
+        return (card.suit == briscola_suit,) + _strength(card)
+
+    cheapest = min(player.hand, key=discard_key)
+    if not game.current_trick:
+        return cheapest
+
+    winning = game.determine_winning_card()
+    winner_seat = (
+        game.current_player_index
+        - len(game.current_trick)
+        + game.current_trick.index(winning)
+    ) % len(game.players)
+    if game.players[winner_seat].team == player.team:
+        return cheapest
+
+    trick_points = sum(card.value for card in game.current_trick)
+    winners: List[Card] = [
+        card for card in player.hand if _beats(card, winning, briscola_suit)
+    ]
+    if trick_points == 0:
+        winners = [card for card in winners if card.suit != briscola_suit]
+    if winners:
+        return min(winners, key=discard_key)
+    return cheapest
+
+
+@register_strategy("endgame")
+def play_endgame(game: BriscolaGame, rng: Optional[random.Random] = None) -> Card:
+    """Plays greedy, switching to the endgame tablebase once the deck is empty."""
+    try:
+        from .tablebase import get_default_tablebase
+    except ImportError:  # numpy is only needed for the endgame tablebase
+        return play_greedy(game, rng)
+
+    tablebase = get_default_tablebase()
+    if tablebase is not None and tablebase.covers(game):
+        return tablebase.best_card(game)
+    return play_greedy(game, rng)
@@ -0,0 +1,349 @@
+"""
+Endgame tablebase for 1v1 Briscola.
+
+Once the deck runs out in a two-player game every remaining card is known to
+both players, so the last three tricks are a perfect-information game that can
+be solved exactly. The generator enumerates every such position, solves it with
+the rules of BriscolaGame.determine_winning_card, and writes the results to a
+flat binary file. The lookup side memory-maps that file, so every process that
+opens it shares the same pages.
+
+Cards are encoded as ``suit_index * 10 + rank_index`` where rank_index follows
+Deck.RANKS (weakest to strongest) and the Briscola suit is always mapped to
+suit index 0; the remaining suits keep their Deck.SUITS order. The file stores,
+for every position with the same number of cards in both hands, the number of
+points the player to move will capture from the remaining cards under perfect
+play. Positions with a card already led are answered by a one-ply search over
+the next smaller table.
+"""
+
+import argparse
+import os
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .briscola import BriscolaGame
+from .deck import Card, Deck
+
+MAGIC = b"BRISCTB1"
+HEADER_SIZE = len(MAGIC)
+NUM_CARDS = 40
+HAND_SIZE = 3
+
+DEFAULT_PATH = os.environ.get(
+    "BRISCOLA_TABLEBASE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "endgame.tb"),
+)
+
+
+def _table_size(n: int) -> int:
+    """Number of (mover hand, opponent hand) pairs with n cards each."""
+    return comb(NUM_CARDS, n) * comb(NUM_CARDS - n, n)
+
+
+# Byte offset of each table within the file, after the header
+_OFFSETS: Dict[int, int] = {}
+_offset = HEADER_SIZE
+for _n in range(1, HAND_SIZE + 1):
+    _OFFSETS[_n] = _offset
+    _offset += _table_size(_n)
+FILE_SIZE = _offset
+
+
+def encode_card(card: Card, briscola_suit: str) -> int:
+    """Encodes a card with the Briscola suit mapped to suit index 0."""
+    other_suits = [suit for suit in Deck.SUITS if suit != briscola_suit]
+    suit_index = 0 if card.suit == briscola_suit else other_suits.index(card.suit) + 1
+    return suit_index * 10 + Deck.RANKS.index(card.rank)
+
+
+@lru_cache(maxsize=1)
+def _card_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Builds the card point values and a 40x40 table telling whether the
+    second card of a two-card trick beats the lead card. The table is built
+    by running BriscolaGame.determine_winning_card on every pair so the
+    tablebase stays consistent with the game engine.
+    """
+    cards = []
+    for code in range(NUM_CARDS):
+        rank = Deck.RANKS[code % 10]
+        cards.append(Card(rank=rank, suit=Deck.SUITS[code // 10], value=Deck.VALUES[rank]))
+    game = BriscolaGame(["Lead", "Follow"])
+    game.briscola_card = cards[0]
+
+    values = np.array([card.value for card in cards], dtype=np.int16)
+    follower_wins = np.zeros((NUM_CARDS, NUM_CARDS), dtype=bool)
+    for lead in range(NUM_CARDS):
+        for follow in range(NUM_CARDS):
+            if lead == follow:
+                continue
+            game.current_trick = [cards[lead], cards[follow]]
+            follower_wins[lead, follow] = (
+                game.determine_winning_card() == cards[follow]
+            )
+    return values, follower_wins
+
+
+@lru_cache(maxsize=None)
+def _binomials() -> np.ndarray:
+    """Table of C(i, k) for i < 41 and k <= HAND_SIZE."""
+    table = np.zeros((NUM_CARDS + 1, HAND_SIZE + 1), dtype=np.int64)
+    for i in range(NUM_CARDS + 1):
+        for k in range(HAND_SIZE + 1):
+            table[i, k] = comb(i, k)
+    return table
+
+
+def _subset_rank(sorted_cards: np.ndarray) -> np.ndarray:
+    """Colex rank of each row of sorted, distinct card codes."""
+    binomials = _binomials()
+    rank = np.zeros(sorted_cards.shape[0], dtype=np.int64)
+    for k in range(sorted_cards.shape[1]):
+        rank += binomials[sorted_cards[:, k], k + 1]
+    return rank
+
+
+def _compress(opponent: np.ndarray, mover: np.ndarray) -> np.ndarray:
+    """Renumbers opponent cards within the deck with the mover's cards removed."""
+    below = (mover[:, None, :] < opponent[:, :, None]).sum(axis=2)
+    return opponent - below
+
+
+def _position_index(mover: np.ndarray, opponent: np.ndarray) -> np.ndarray:
+    """Index of each (mover, opponent) row pair within its table."""
+    n = mover.shape[1]
+    return _subset_rank(mover) * comb(NUM_CARDS - n, n) + _subset_rank(
+        _compress(opponent, mover)
+    )
+
+
+def _subsets(pool: int, n: int) -> np.ndarray:
+    """All sorted n-subsets of range(pool), ordered by colex rank."""
+    rows = list(_combinations_colex(pool, n))
+    return np.array(rows, dtype=np.int64).reshape(-1, n)
+
+
+def _combinations_colex(pool: int, n: int):
+    """Yields the sorted n-subsets of range(pool) in colex order."""
+    if n == 0:
+        yield ()
+        return
+    for last in range(n - 1, pool):
+        for head in _combinations_colex(last, n - 1):
+            yield head + (last,)
+
+
+def _solve_layer(n: int, previous: Optional[np.ndarray]) -> np.ndarray:
+    """Solves all lead positions with n cards per hand from the n - 1 table."""
+    values, follower_wins = _card_tables()
+    table = np.zeros(_table_size(n), dtype=np.uint8)
+    opponent_subsets = _subsets(NUM_CARDS - n, n)
+    block = opponent_subsets.shape[0]
+    keep = [[c for c in range(n) if c != i] for i in range(n)]
+
+    for mover_rank, mover_hand in enumerate(_subsets(NUM_CARDS, n)):
+        remaining = np.setdiff1d(np.arange(NUM_CARDS), mover_hand)
+        opponents = remaining[opponent_subsets]
+        movers = np.broadcast_to(mover_hand, opponents.shape)
+        best = np.zeros(block, dtype=np.int16)
+
+        for i in range(n):
+            lead = mover_hand[i]
+            mover_rest = movers[:, keep[i]]
+            worst = np.full(block, np.iinfo(np.int16).max, dtype=np.int16)
+            for j in range(n):
+                follow = opponents[:, j]
+                opponent_rest = opponents[:, keep[j]]
+                follower_won = follower_wins[lead, follow]
+                trick_points = values[lead] + values[follow]
+                outcome = np.where(follower_won, 0, trick_points)
+                if previous is not None:
+                    left = values[mover_rest].sum(axis=1) + values[opponent_rest].sum(
+                        axis=1
+                    )
+                    mover_leads = previous[_position_index(mover_rest, opponent_rest)]
+                    opponent_leads = previous[
+                        _position_index(opponent_rest, mover_rest)
+                    ]
+                    outcome = outcome + np.where(
+                        follower_won, left - opponent_leads, mover_leads
+                    )
+                worst = np.minimum(worst, outcome)
+            best = np.maximum(best, worst)
+
+        start = mover_rank * block
+        table[start : start + block] = best
+    return table
+
+
+def generate(path: str = DEFAULT_PATH) -> None:
+    """Solves every 1v1 endgame position and writes the tablebase to path."""
+    previous = None
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        for n in range(1, HAND_SIZE + 1):
+            previous = _solve_layer(n, previous)
+            f.write(previous.tobytes())
+    os.replace(tmp_path, path)
+
+
+class EndgameTablebase:
+    """Read-only, memory-mapped view of a generated endgame tablebase."""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        with open(path, "rb") as f:
+            if f.read(HEADER_SIZE) != MAGIC:
+                raise ValueError(f"{path} is not a Briscola endgame tablebase")
+        if os.path.getsize(path) != FILE_SIZE:
+            raise ValueError(f"{path} has an unexpected size")
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        self._tables = {
+            n: data[_OFFSETS[n] : _OFFSETS[n] + _table_size(n)]
+            for n in range(1, HAND_SIZE + 1)
+        }
+        self._values, self._follower_wins = _card_tables()
+
+    def _lead_value(self, mover: Sequence[int], opponent: Sequence[int]) -> int:
+        if not mover:
+            return 0
+        index = _position_index(
+            np.array([sorted(mover)], dtype=np.int64),
+            np.array([sorted(opponent)], dtype=np.int64),
+        )[0]
+        return int(self._tables[len(mover)][index])
+
+    def _reply_value(
+        self, lead: int, leader_rest: Sequence[int], follower: Sequence[int]
+    ) -> Tuple[int, int]:
+        """Returns the follower's best value and the card achieving it."""
+        values = self._values
+        best_value, best_card = -1, follower[0]
+        for card in follower:
+            follower_rest = [c for c in follower if c != card]
+            left = int(values[list(leader_rest)].sum() + values[follower_rest].sum())
+            if self._follower_wins[lead, card]:
+                value = int(values[lead] + values[card]) + self._lead_value(
+                    follower_rest, leader_rest
+                )
+            else:
+                value = left - self._lead_value(leader_rest, follower_rest)
+            if value > best_value:
+                best_value, best_card = value, card
+        return best_value, best_card
+
+    def value(
+        self, mover_hand: List[Card], opponent_hand: List[Card], briscola_suit: str
+    ) -> int:
+        """
+        Returns the points the player to move will capture from the cards
+        still in both hands, assuming perfect play from both sides.
+        """
+        mover = [encode_card(card, briscola_suit) for card in mover_hand]
+        opponent = [encode_card(card, briscola_suit) for card in opponent_hand]
+        if len(mover) != len(opponent) or len(mover) > HAND_SIZE:
+            raise ValueError("Both hands must hold the same number of cards (at most 3)")
+        return self._lead_value(mover, opponent)
+
+    def reply_value(
+        self,
+        led_card: Card,
+        leader_hand: List[Card],
+        follower_hand: List[Card],
+        briscola_suit: str,
+    ) -> int:
+        """
+        Returns the points the following player will capture from the led
+        card and the cards still in both hands, assuming perfect play.
+        """
+        lead = encode_card(led_card, briscola_suit)
+        leader = [encode_card(card, briscola_suit) for card in leader_hand]
+        follower = [encode_card(card, briscola_suit) for card in follower_hand]
+        if len(follower) != len(leader) + 1 or len(follower) > HAND_SIZE:
+            raise ValueError("The follower must hold exactly one card more than the leader")
+        return self._reply_value(lead, leader, follower)[0]
+
+    def covers(self, game: BriscolaGame) -> bool:
+        """Checks whether the game is in a position the tablebase can solve."""
+        return (
+            len(game.players) == 2
+            and not game.deck.cards
+            and not game.is_game_over()
+        )
+
+    def best_card(self, game: BriscolaGame) -> Card:
+        """Returns the perfect-play card for the current player of a 1v1 endgame."""
+        if not self.covers(game):
+            raise ValueError("The tablebase only covers 1v1 games with an empty deck")
+        briscola_suit = game.briscola_card.suit
+        mover = game.get_current_player()
+        opponent = game.players[1 - game.current_player_index]
+        encoded = {encode_card(card, briscola_suit): card for card in mover.hand}
+        opponent_codes = [encode_card(card, briscola_suit) for card in opponent.hand]
+
+        if game.current_trick:
+            lead = encode_card(game.current_trick[0], briscola_suit)
+            return encoded[self._reply_value(lead, opponent_codes, list(encoded))[1]]
+
+        best_value, best_code = -1, None
+        for code in encoded:
+            # The opponent replies to our lead, so our share is what they leave us
+            rest = [c for c in encoded if c != code]
+            total = int(
+                self._values[code]
+                + self._values[rest].sum()
+                + self._values[opponent_codes].sum()
+            )
+            value = total - self._reply_value(code, rest, opponent_codes)[0]
+            if value > best_value:
+                best_value, best_code = value, code
+        return encoded[best_code]
+
+    def final_scores(self, game: BriscolaGame) -> Dict[str, int]:
+        """Returns each player's final score under perfect play from here."""
+        if not self.covers(game):
+            raise ValueError("The tablebase only covers 1v1 games with an empty deck")
+        briscola_suit = game.briscola_card.suit
+        mover = game.get_current_player()
+        opponent = game.players[1 - game.current_player_index]
+        in_play = sum(card.value for card in mover.hand + opponent.hand)
+        in_play += sum(card.value for card in game.current_trick)
+
+        if game.current_trick:
+            mover_points = self.reply_value(
+                game.current_trick[0], opponent.hand, mover.hand, briscola_suit
+            )
+        else:
+            mover_points = self.value(mover.hand, opponent.hand, briscola_suit)
+        return {
+            mover.name: mover.score + mover_points,
+            opponent.name: opponent.score + in_play - mover_points,
+        }
+
+
+_default_tablebase: Optional[EndgameTablebase] = None
+
+
+def get_default_tablebase() -> Optional[EndgameTablebase]:
+    """Opens the tablebase at DEFAULT_PATH once, or returns None if it is missing."""
+    global _default_tablebase
+    if _default_tablebase is None and os.path.exists(DEFAULT_PATH):
+        _default_tablebase = EndgameTablebase(DEFAULT_PATH)
+    return _default_tablebase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the 1v1 endgame tablebase.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    args = parser.parse_args()
+    generate(args.path)
+    print(f"Wrote {FILE_SIZE} bytes to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,76 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Dict
-from briscola import BriscolaGame, Card, Player
+from briscola import BriscolaGame, Card, GameEvent, Player
+from briscola.strategies import get_strategy
+
+# Delay between polls for an AI move computed off the Tk main thread
+AI_POLL_MS = 50
+
+
+def card_label(card: Card) -> str:
+    """Text shown for a card."""
+    return f"{card.rank} of {card.suit}"
+
+
+class PlayerPanel:
+    """Persistent widgets for one player: name/score label and a hand of card buttons."""
+
+    def __init__(self, master: tk.Misc, gui: "BriscolaGUI", player_name: str):
+        """
+        Build the panel once; later updates only change bound variables and states.
+
+        Args:
+            master (tk.Misc): The parent widget.
+            gui (BriscolaGUI): The GUI receiving card clicks.
+            player_name (str): The name of the player shown in the panel.
+        """
+        self.player_name = player_name
+        self.frame = ttk.Frame(master, padding="10", relief="raised")
+        self.frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.title_var = tk.StringVar()
+        ttk.Label(
+            self.frame, textvariable=self.title_var, style="PlayerName.TLabel"
+        ).pack(pady=5)
+
+        hand_frame = ttk.Frame(self.frame)
+        hand_frame.pack()
+
+        self.card_vars: List[tk.StringVar] = []
+        self.card_buttons: List[ttk.Button] = []
+        for slot in range(3):
+            var = tk.StringVar()
+            btn = ttk.Button(
+                hand_frame,
+                textvariable=var,
+                command=lambda s=slot: gui.on_card_clicked(self.player_name, s),
+                style="PlayerCard.TButton",
+            )
+            btn.grid(row=0, column=slot, padx=2)
+            self.card_vars.append(var)
+            self.card_buttons.append(btn)
+
+    def set_score(self, score: int) -> None:
+        """Show the player's current score."""
+        self.title_var.set(f"{self.player_name} (Score: {score})")
+
+    def set_hand(self, hand: List[Card]) -> None:
+        """Show the cards in the player's hand, hiding unused slots."""
+        for slot, (var, btn) in enumerate(zip(self.card_vars, self.card_buttons)):
+            if slot < len(hand):
+                var.set(card_label(hand[slot]))
+                btn.grid()
+            else:
+                var.set("")
+                btn.grid_remove()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable all card buttons."""
+        for btn in self.card_buttons:
+            btn.state(["!disabled"] if enabled else ["disabled"])
 
 
 class BriscolaGUI:
@@ -19,138 +88,174 @@ class BriscolaGUI:
         self.master.geometry("900x700")
         self.master.configure(bg="#f0f0f0")  # Light gray background
 
+        self.ai_strategy = get_strategy("endgame")
+        self.ai_results: "queue.Queue" = queue.Queue()
+        self.ai_thinking = False
+
+        self.setup_styles()
         self.setup_ui()
+        self.attach_game(game)
+
+    def setup_styles(self):
+        """Configure the ttk styles once for the lifetime of the window."""
+        style = ttk.Style()
+        style.configure("Info.TLabel", font=("Helvetica", 12))
+        style.configure("PlayerName.TLabel", font=("Helvetica", 14, "bold"))
+        style.configure("PlayerCard.TButton", font=("Helvetica", 10))
+        style.configure("CurrentTrick.TLabel", font=("Helvetica", 12))
+        style.configure("GameOver.TLabel", font=("Helvetica", 16, "bold"))
 
     def setup_ui(self):
         """Set up the main UI components."""
         self.info_frame = ttk.Frame(self.master, padding="10", relief="ridge")
         self.info_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        self.player_frames: Dict[str, ttk.Frame] = {}
+        self.current_player_var = tk.StringVar()
+        self.briscola_var = tk.StringVar()
+        self.tricks_var = tk.StringVar()
+        self.deck_var = tk.StringVar()
+        for var in (
+            self.current_player_var,
+            self.briscola_var,
+            self.tricks_var,
+            self.deck_var,
+        ):
+            ttk.Label(self.info_frame, textvariable=var, style="Info.TLabel").pack(
+                pady=2
+            )
+
+        self.player_panels: Dict[str, PlayerPanel] = {}
         for player in self.game.players:
-            frame = ttk.Frame(self.master, padding="10", relief="raised")
-            frame.pack(fill=tk.X, padx=10, pady=5)
-            self.player_frames[player.name] = frame
+            self.player_panels[player.name] = PlayerPanel(self.master, self, player.name)
 
         self.action_frame = ttk.Frame(self.master, padding="10", relief="sunken")
         self.action_frame.pack(fill=tk.X, padx=10, pady=10)
 
+        self.trick_frame = ttk.Frame(self.action_frame)
+        ttk.Label(
+            self.trick_frame, text="Current Trick:", style="CurrentTrick.TLabel"
+        ).pack(pady=5)
+        self.trick_var = tk.StringVar()
+        ttk.Label(
+            self.trick_frame,
+            textvariable=self.trick_var,
+            style="CurrentTrick.TLabel",
+            justify=tk.CENTER,
+        ).pack()
+
+        self.game_over_frame = ttk.Frame(self.action_frame)
+        self.game_over_var = tk.StringVar()
+        ttk.Label(
+            self.game_over_frame,
+            textvariable=self.game_over_var,
+            style="GameOver.TLabel",
+        ).pack(pady=10)
+        ttk.Button(self.game_over_frame, text="New Game", command=self.new_game).pack(
+            pady=5
+        )
+
         self.message_var = tk.StringVar()
         self.message_label = ttk.Label(
             self.master, textvariable=self.message_var, font=("Helvetica", 12)
         )
         self.message_label.pack(pady=10)
 
+    def attach_game(self, game: BriscolaGame):
+        """
+        Subscribe to a game's events and sync every widget with it once.
+
+        Args:
+            game (BriscolaGame): The game to display.
+        """
+        self.game = game
+        # In a 2-player game the second seat is played by the computer
+        if len(game.players) == 2:
+            game.players[1].is_ai = True
+        game.subscribe(self.on_game_event)
         self.update_ui()
 
     def update_ui(self):
-        """Update the UI to reflect the current game state."""
-        self.update_info_frame()
-        self.update_player_frames()
-        self.update_action_frame()
+        """Update every widget to reflect the full game state."""
+        self.briscola_var.set(f"Briscola: {card_label(self.game.briscola_card)}")
+        self.tricks_var.set(f"Tricks Played: {self.game.tricks_played}")
+        self.deck_var.set(f"Cards in Deck: {len(self.game.deck.cards)}")
+        self.trick_var.set("\n".join(card_label(c) for c in self.game.current_trick))
+        for player in self.game.players:
+            panel = self.player_panels[player.name]
+            panel.set_score(player.score)
+            panel.set_hand(player.hand)
+        if self.game.is_game_over():
+            self.show_game_over()
+        else:
+            self.game_over_frame.pack_forget()
+            self.trick_frame.pack()
+            self.show_turn()
 
-    def update_info_frame(self):
-        """Update the information display."""
-        for widget in self.info_frame.winfo_children():
-            widget.destroy()
+    def on_game_event(self, event: GameEvent):
+        """
+        Apply a single engine event to the widgets it affects.
 
-        style = ttk.Style()
-        style.configure("Info.TLabel", font=("Helvetica", 12))
+        Args:
+            event (GameEvent): The event published by the game.
+        """
+        if event.type == "card_played":
+            self.player_panels[event.player].set_hand(self.player(event.player).hand)
+            self.trick_var.set(
+                "\n".join(card_label(c) for c in self.game.current_trick)
+            )
+        elif event.type == "trick_won":
+            self.player_panels[event.player].set_score(self.player(event.player).score)
+            self.tricks_var.set(f"Tricks Played: {self.game.tricks_played}")
+            self.trick_var.set("")
+        elif event.type == "card_drawn":
+            self.player_panels[event.player].set_hand(self.player(event.player).hand)
+            self.deck_var.set(f"Cards in Deck: {len(self.game.deck.cards)}")
+        elif event.type == "turn":
+            self.show_turn()
+        elif event.type == "game_over":
+            self.show_game_over()
 
-        ttk.Label(
-            self.info_frame,
-            text=f"Current Player: {self.game.get_current_player().name}",
-            style="Info.TLabel",
-        ).pack(pady=2)
-        ttk.Label(
-            self.info_frame,
-            text=f"Briscola: {self.game.briscola_card.rank} of {self.game.briscola_card.suit}",
-            style="Info.TLabel",
-        ).pack(pady=2)
-        ttk.Label(
-            self.info_frame,
-            text=f"Tricks Played: {self.game.tricks_played}",
-            style="Info.TLabel",
-        ).pack(pady=2)
-        ttk.Label(
-            self.info_frame,
-            text=f"Cards in Deck: {len(self.game.deck.cards)}",
-            style="Info.TLabel",
-        ).pack(pady=2)
+    def player(self, name: str) -> Player:
+        """Return the player with the given name."""
+        return next(p for p in self.game.players if p.name == name)
 
-    def update_player_frames(self):
-        """Update the display of players' hands and scores."""
+    def show_turn(self):
+        """Show whose turn it is and hand control to them."""
+        current = self.game.get_current_player()
+        self.current_player_var.set(f"Current Player: {current.name}")
         for player in self.game.players:
-            frame = self.player_frames[player.name]
-            for widget in frame.winfo_children():
-                widget.destroy()
-
-            style = ttk.Style()
-            style.configure("PlayerName.TLabel", font=("Helvetica", 14, "bold"))
-            style.configure("PlayerCard.TButton", font=("Helvetica", 10))
-
-            ttk.Label(
-                frame,
-                text=f"{player.name} (Score: {player.score})",
-                style="PlayerName.TLabel",
-            ).pack(pady=5)
-
-            hand_frame = ttk.Frame(frame)
-            hand_frame.pack()
-
-            for card in player.hand:
-                btn = ttk.Button(
-                    hand_frame,
-                    text=f"{card.rank} of {card.suit}",
-                    command=lambda p=player, c=card: self.play_card(p, c),
-                    style="PlayerCard.TButton",
-                )
-                btn.pack(side=tk.LEFT, padx=2)
-                if player != self.game.get_current_player():
-                    btn.state(["disabled"])
-
-    def update_action_frame(self):
-        """Update the action buttons and current trick display."""
-        for widget in self.action_frame.winfo_children():
-            widget.destroy()
-
-        if self.game.is_game_over():
-            winner = self.game.get_winner()
-            style = ttk.Style()
-            style.configure("GameOver.TLabel", font=("Helvetica", 16, "bold"))
-            if isinstance(winner, Player):
-                ttk.Label(
-                    self.action_frame,
-                    text=f"Game Over! Winner: {winner.name}",
-                    style="GameOver.TLabel",
-                ).pack(pady=10)
-            elif isinstance(winner, int):
-                ttk.Label(
-                    self.action_frame,
-                    text=f"Game Over! Winning Team: {winner}",
-                    style="GameOver.TLabel",
-                ).pack(pady=10)
-            else:
-                ttk.Label(
-                    self.action_frame,
-                    text="Game Over! It's a tie!",
-                    style="GameOver.TLabel",
-                ).pack(pady=10)
-            ttk.Button(self.action_frame, text="New Game", command=self.new_game).pack(
-                pady=5
+            self.player_panels[player.name].set_enabled(
+                player == current and not player.is_ai and not self.ai_thinking
             )
+        if current.is_ai and not self.ai_thinking:
+            self.start_ai_move(current)
+
+    def show_game_over(self):
+        """Show the winner and the New Game button."""
+        winner = self.game.get_winner()
+        if isinstance(winner, Player):
+            self.game_over_var.set(f"Game Over! Winner: {winner.name}")
+        elif isinstance(winner, int):
+            self.game_over_var.set(f"Game Over! Winning Team: {winner}")
         else:
-            style = ttk.Style()
-            style.configure("CurrentTrick.TLabel", font=("Helvetica", 12))
-            ttk.Label(
-                self.action_frame, text="Current Trick:", style="CurrentTrick.TLabel"
-            ).pack(pady=5)
-            for card in self.game.current_trick:
-                ttk.Label(
-                    self.action_frame,
-                    text=f"{card.rank} of {card.suit}",
-                    style="CurrentTrick.TLabel",
-                ).pack()
+            self.game_over_var.set("Game Over! It's a tie!")
+        self.current_player_var.set("")
+        for panel in self.player_panels.values():
+            panel.set_enabled(False)
+        self.trick_frame.pack_forget()
+        self.game_over_frame.pack()
+
+    def on_card_clicked(self, player_name: str, slot: int):
+        """
+        Handle a click on one of a player's card buttons.
+
+        Args:
+            player_name (str): The player whose hand was clicked.
+            slot (int): The position of the card in the player's hand.
+        """
+        player = self.player(player_name)
+        if slot < len(player.hand):
+            self.play_card(player, player.hand[slot])
 
     def play_card(self, player: Player, card: Card):
         """
@@ -160,21 +265,51 @@ class BriscolaGUI:
             player (Player): The player playing the card.
             card (Card): The card being played.
         """
-        if player == self.game.get_current_player():
+        if player == self.game.get_current_player() and not self.ai_thinking:
             self.game.play_turn(card)
-            self.update_ui()
-
-            # Automatically play for other players if it's a 2-player game
-            if len(self.game.players) == 2 and not self.game.is_game_over():
-                other_player = [p for p in self.game.players if p != player][0]
-                if other_player.hand:
-                    auto_card = other_player.hand[0]  # Play the first card in hand
-                    self.game.play_turn(auto_card)
-                    self.message_var.set(
-                        f"{other_player.name} played {auto_card.rank} of {auto_card.suit}"
-                    )
-                    self.master.after(3000, self.clear_message)
-                self.update_ui()
+
+    def start_ai_move(self, player: Player):
+        """
+        Choose the AI player's card on a worker thread so the UI stays responsive.
+
+        Args:
+            player (Player): The AI player to move.
+        """
+        self.ai_thinking = True
+        game = self.game
+
+        def think():
+            try:
+                result = self.ai_strategy(game)
+            except Exception as e:  # Reported and recovered from on the main thread
+                result = e
+            self.ai_results.put((game, player.name, result))
+
+        threading.Thread(target=think, daemon=True).start()
+        self.master.after(AI_POLL_MS, self.poll_ai_move)
+
+    def poll_ai_move(self):
+        """Apply a finished AI move on the Tk main thread, or keep polling."""
+        try:
+            game, player_name, result = self.ai_results.get_nowait()
+        except queue.Empty:
+            self.master.after(AI_POLL_MS, self.poll_ai_move)
+            return
+
+        self.ai_thinking = False
+        if game is not self.game:
+            return  # A new game was started while the AI was thinking
+        if isinstance(result, Exception):
+            # Fall back to a legal card so the game never stalls on a failing strategy
+            card = self.player(player_name).hand[0]
+            self.message_var.set(
+                f"AI error ({result}); {player_name} played {card_label(card)}"
+            )
+        else:
+            card = result
+            self.message_var.set(f"{player_name} played {card_label(card)}")
+        self.master.after(3000, self.clear_message)
+        self.game.play_turn(card)
 
     def clear_message(self):
         """Clear the message display."""
@@ -182,11 +317,11 @@ class BriscolaGUI:
 
     def new_game(self):
         """Start a new game."""
+        self.game.unsubscribe(self.on_game_event)
         player_names = [player.name for player in self.game.players]
-        self.game = BriscolaGame(player_names)
         self.message_var.set("New game started!")
-        self.master.after(3000, self.clear_message)  
-        self.update_ui()
+        self.master.after(3000, self.clear_message)
+        self.attach_game(BriscolaGame(player_names))
 
 
 def main():
@@ -0,0 +1,346 @@
+"""
+Load-testing harness for the Briscola API.
+
+Simulated players create games with POST /games, poll GET /games/{id} until it
+is their turn, pick a card from their hand via GET /games/{id}/view, play it
+with POST /games/{id}/play and check GET /games/{id}/winner once the game
+ends. Each table starts a fresh game as soon as the previous one finishes, so
+the load is sustained for the whole run.
+
+By default the app is driven in-process over ASGI, which shares the event
+loop with the load generator; point --url at a uvicorn worker for numbers
+that reflect a real deployment.
+
+Usage:
+    python loadtest.py --players 1000 --duration 30
+    python loadtest.py --url http://localhost:8000 --find-saturation
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel
+
+# Error rate above which a load level counts as saturated
+MAX_ERROR_RATE = 0.01
+
+
+class LoadConfig(BaseModel):
+    """Parameters of a single load level."""
+
+    players: int = 100
+    duration: float = 30.0
+    think_time: float = 0.5
+    think_jitter: float = 0.5
+    poll_interval: float = 0.2
+    mix_2v2: float = 0.5
+    timeout: float = 10.0
+
+
+class EndpointStats(BaseModel):
+    """Latency percentiles and error counts for one route."""
+
+    requests: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+
+
+class LoadReport(BaseModel):
+    """Aggregate results of a load level."""
+
+    players: int
+    duration: float
+    requests: int
+    errors: int
+    games_finished: int
+    throughput: float
+    error_rate: float
+    p50: float
+    p95: float
+    p99: float
+    endpoints: Dict[str, EndpointStats]
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"{self.players:>6} players: {self.throughput:8.1f} req/s, "
+            f"{self.games_finished / self.duration:6.2f} games/s, "
+            f"p50 {self.p50 * 1000:7.1f} ms, p95 {self.p95 * 1000:7.1f} ms, "
+            f"p99 {self.p99 * 1000:7.1f} ms, errors {self.error_rate:.2%}"
+        )
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """Collects request latencies and errors per route."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.games_finished = 0
+
+    async def request(
+        self, client: httpx.AsyncClient, method: str, url: str, route: str, **kwargs
+    ) -> Optional[httpx.Response]:
+        """Sends a request, recording its latency; returns None on failure."""
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        self.latencies[route].append(time.perf_counter() - start)
+        if response is None or response.status_code >= 400:
+            self.errors[route] += 1
+            return None
+        return response
+
+    def report(self, players: int, duration: float) -> LoadReport:
+        """Builds the report for everything recorded so far."""
+        endpoints = {}
+        for route, values in sorted(self.latencies.items()):
+            values.sort()
+            endpoints[route] = EndpointStats(
+                requests=len(values),
+                errors=self.errors[route],
+                p50=percentile(values, 0.50),
+                p95=percentile(values, 0.95),
+                p99=percentile(values, 0.99),
+            )
+        everything = sorted(v for values in self.latencies.values() for v in values)
+        errors = sum(self.errors.values())
+        return LoadReport(
+            players=players,
+            duration=duration,
+            requests=len(everything),
+            errors=errors,
+            games_finished=self.games_finished,
+            throughput=len(everything) / duration,
+            error_rate=errors / len(everything) if everything else 0.0,
+            p50=percentile(everything, 0.50),
+            p95=percentile(everything, 0.95),
+            p99=percentile(everything, 0.99),
+            endpoints=endpoints,
+        )
+
+
+async def think(config: LoadConfig) -> None:
+    """Sleeps for the configured think time with uniform jitter."""
+    jitter = config.think_time * config.think_jitter
+    await asyncio.sleep(max(0.0, config.think_time + random.uniform(-jitter, jitter)))
+
+
+async def play_seat(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    config: LoadConfig,
+    game_id: str,
+    name: str,
+    deadline: float,
+) -> None:
+    """Plays one seat of a game until it ends or the deadline passes."""
+    while time.monotonic() < deadline:
+        response = await recorder.request(
+            client, "GET", f"/games/{game_id}", "GET /games/{game_id}"
+        )
+        if response is None:
+            await asyncio.sleep(config.poll_interval)
+            continue
+        state = response.json()
+        if all(player["hand_size"] == 0 for player in state["players"]):
+            return
+        if state["current_player"] != name:
+            await asyncio.sleep(config.poll_interval)
+            continue
+
+        await think(config)
+        response = await recorder.request(
+            client,
+            "GET",
+            f"/games/{game_id}/view",
+            "GET /games/{game_id}/view",
+            params={"player": name},
+        )
+        if response is None or not response.json()["hand"]:
+            continue
+        card = random.choice(response.json()["hand"])
+        await recorder.request(
+            client,
+            "POST",
+            f"/games/{game_id}/play",
+            "POST /games/{game_id}/play",
+            json={
+                "player_name": name,
+                "card": {"rank": card["rank"], "suit": card["suit"]},
+            },
+        )
+
+
+async def run_table(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    config: LoadConfig,
+    seats: int,
+    deadline: float,
+) -> None:
+    """Plays back-to-back games with the given number of simulated players."""
+    while time.monotonic() < deadline:
+        names = [f"Player {i + 1}" for i in range(seats)]
+        response = await recorder.request(
+            client, "POST", "/games", "POST /games", json={"player_names": names}
+        )
+        if response is None:
+            await asyncio.sleep(config.poll_interval)
+            continue
+        game_id = response.json()
+        await asyncio.gather(
+            *(
+                play_seat(client, recorder, config, game_id, name, deadline)
+                for name in names
+            )
+        )
+        if time.monotonic() >= deadline:
+            return
+        response = await recorder.request(
+            client, "GET", f"/games/{game_id}/winner", "GET /games/{game_id}/winner"
+        )
+        if response is not None:
+            recorder.games_finished += 1
+        # Free server memory so long runs measure steady state, not growth
+        await recorder.request(
+            client, "DELETE", f"/games/{game_id}", "DELETE /games/{game_id}"
+        )
+
+
+def table_sizes(config: LoadConfig) -> List[int]:
+    """Splits the simulated players into 1v1 and 2v2 tables following the mix."""
+    sizes = []
+    remaining = config.players
+    while remaining >= 2:
+        seats = 4 if remaining >= 4 and random.random() < config.mix_2v2 else 2
+        sizes.append(seats)
+        remaining -= seats
+    return sizes
+
+
+def make_client(url: Optional[str], timeout: float) -> httpx.AsyncClient:
+    """Creates a client for a live server, or for the in-process app if url is None."""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits)
+    from api.main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        timeout=timeout,
+    )
+
+
+async def run_load(config: LoadConfig, url: Optional[str] = None) -> LoadReport:
+    """Runs one load level for config.duration seconds and returns its report."""
+    recorder = Recorder()
+    start = time.monotonic()
+    deadline = start + config.duration
+    async with make_client(url, config.timeout) as client:
+        await asyncio.gather(
+            *(
+                run_table(client, recorder, config, seats, deadline)
+                for seats in table_sizes(config)
+            )
+        )
+    return recorder.report(config.players, time.monotonic() - start)
+
+
+async def find_saturation(
+    config: LoadConfig,
+    url: Optional[str] = None,
+    max_players: int = 20000,
+    growth: float = 2.0,
+    p99_slo: float = 0.5,
+    max_error_rate: float = MAX_ERROR_RATE,
+    min_gain: float = 0.05,
+) -> List[LoadReport]:
+    """
+    Raises the number of players geometrically until the p99 latency exceeds
+    p99_slo, the error rate exceeds max_error_rate, or throughput grows by less
+    than min_gain. Returns the report of every level that was run.
+    """
+    reports: List[LoadReport] = []
+    players = config.players
+    while players <= max_players:
+        report = await run_load(config.model_copy(update={"players": players}), url)
+        reports.append(report)
+        print(report.summary())
+        if report.p99 > p99_slo or report.error_rate > max_error_rate:
+            break
+        if len(reports) > 1 and report.throughput < reports[-2].throughput * (
+            1 + min_gain
+        ):
+            break
+        players = int(players * growth)
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Briscola API.")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--think-time", type=float, default=0.5)
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--mix-2v2", type=float, default=0.5)
+    parser.add_argument("--find-saturation", action="store_true")
+    parser.add_argument("--max-players", type=int, default=20000)
+    parser.add_argument("--p99-slo", type=float, default=0.5)
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        players=args.players,
+        duration=args.duration,
+        think_time=args.think_time,
+        poll_interval=args.poll_interval,
+        mix_2v2=args.mix_2v2,
+    )
+    if args.find_saturation:
+        reports = asyncio.run(
+            find_saturation(
+                config, args.url, max_players=args.max_players, p99_slo=args.p99_slo
+            )
+        )
+        healthy = [
+            r for r in reports if r.p99 <= args.p99_slo and r.error_rate <= MAX_ERROR_RATE
+        ]
+        if healthy:
+            best = max(healthy, key=lambda r: r.throughput)
+            print(f"Saturation point: ~{best.players} players, {best.throughput:.1f} req/s")
+        else:
+            print("Even the first load level missed the latency/error targets")
+        return
+
+    report = asyncio.run(run_load(config, args.url))
+    print(report.summary())
+    for route, stats in report.endpoints.items():
+        print(
+            f"  {route:<32} {stats.requests:>8} req, {stats.errors:>5} err, "
+            f"p50 {stats.p50 * 1000:6.1f} ms, p95 {stats.p95 * 1000:6.1f} ms, "
+            f"p99 {stats.p99 * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
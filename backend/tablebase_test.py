@@ -0,0 +1,82 @@
+import argparse
+import os
+import random
+import sys
+from typing import Dict
+from briscola import BriscolaGame
+from briscola.tablebase import DEFAULT_PATH, EndgameTablebase, generate
+
+
+def play_to_endgame(seed: int) -> BriscolaGame:
+    """Play random cards from a seeded deal until the deck is empty, sometimes mid-trick."""
+    rng = random.Random(seed)
+    random.seed(seed)  # The engine shuffles with the global random module
+    game = BriscolaGame(["Player 1", "Player 2"])
+    while game.deck.cards or rng.random() < 0.3:
+        if game.is_game_over():
+            break
+        game.play_turn(rng.choice(game.get_current_player().hand))
+    return game
+
+
+def solve(game: BriscolaGame) -> Dict[str, int]:
+    """Return the final scores under perfect play by searching every line with the engine."""
+    if game.is_game_over():
+        return {player.name: player.score for player in game.players}
+    mover = game.get_current_player().name
+    best = None
+    for card in list(game.get_current_player().hand):
+        child = game.model_copy(deep=True)
+        child.play_turn(card)
+        scores = solve(child)
+        if best is None or scores[mover] > best[mover]:
+            best = scores
+    return best
+
+
+def check_endgames(tablebase: EndgameTablebase, count: int) -> int:
+    """Compare the tablebase with the engine search on seeded endgames; return the mismatches."""
+    mismatches = 0
+    checked = 0
+    seed = 0
+    while checked < count:
+        game = play_to_endgame(seed)
+        seed += 1
+        if not tablebase.covers(game):
+            continue
+        checked += 1
+
+        expected = solve(game)
+        scores = tablebase.final_scores(game)
+        if scores != expected:
+            mismatches += 1
+            print(f"Seed {seed - 1}: final scores {scores}, expected {expected}")
+
+        mover = game.get_current_player().name
+        after_best = game.model_copy(deep=True)
+        after_best.play_turn(tablebase.best_card(game))
+        if solve(after_best)[mover] != expected[mover]:
+            mismatches += 1
+            print(f"Seed {seed - 1}: best_card is not a perfect-play move")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the endgame tablebase against the engine.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Generating {args.path} (about a minute)...")
+        generate(args.path)
+
+    mismatches = check_endgames(EndgameTablebase(args.path), args.count)
+    if mismatches:
+        print(f"{mismatches} mismatches in {args.count} endgames")
+        sys.exit(1)
+    print(f"All {args.count} endgames match the engine search")
+
+
+if __name__ == "__main__":
+    main()